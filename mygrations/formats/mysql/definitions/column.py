@@ -7,6 +7,7 @@ class column(object):
     _auto_increment = None
     _errors = None
     _warnings = None
+    _str = None
 
     def __init__(
         self,
@@ -179,6 +180,10 @@ class column(object):
         :returns: A partial MySQL command that could be used to generate the column
         :rtype: string
         """
+        # definitions don't change once built, so the string only needs to be built once
+        if self._str is not None:
+            return self._str
+
         parts = []
         parts.append('`%s`' % self.name)
 
@@ -214,7 +219,8 @@ class column(object):
         if self.collate:
             parts.append("COLLATE '%s'" % self.collate)
 
-        return ' '.join(parts)
+        self._str = ' '.join(parts)
+        return self._str
 
     def is_really_the_same_as(self, column):
         """ Takes care of a pesky false-positive when checking columns
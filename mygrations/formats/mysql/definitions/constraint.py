@@ -8,6 +8,7 @@ class constraint(object):
     _foreign_column = ''
     _on_delete = ''
     _on_update = ''
+    _str = None
 
     def __init__(self, name='', column='', foreign_table='', foreign_column='', on_delete='', on_update=''):
         self._name = name
@@ -103,6 +104,9 @@ class constraint(object):
         :returns: A partial MySQL command that could be used to generate the foreign key
         :rtype: string
         """
+        if self._str is not None:
+            return self._str
+
         parts = ['CONSTRAINT']
 
         parts.append('`%s`' % self.name)
@@ -114,4 +118,5 @@ class constraint(object):
         parts.append('ON DELETE %s' % self.on_delete)
         parts.append('ON UPDATE %s' % self.on_update)
 
-        return ' '.join(parts)
+        self._str = ' '.join(parts)
+        return self._str
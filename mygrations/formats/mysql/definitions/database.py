@@ -5,6 +5,7 @@ class database(object):
     _tables = None
     _rows = None
     _errors_1215 = None
+    _fk_edges = None
 
     def __init__(self):
         self._warnings = []
@@ -12,6 +13,7 @@ class database(object):
         self._tables = {}
         self._rows = []
         self._errors_1215 = None
+        self._fk_edges = None
 
     @property
     def tables(self):
@@ -51,6 +53,97 @@ class database(object):
             self._errors_1215 = self._find_all_1215_errors()
         return self._errors_1215
 
+    @property
+    def fk_edges(self):
+        """ Public getter.  Returns the tables referenced by the foreign keys of each table
+
+        The result is a dict keyed by table name.  The values are tuples with the names of
+        the tables referenced by the foreign keys of that table, in the order of the constraints
+        and without duplicates.  Tables without foreign keys are left out.  This is calculated
+        once and cached until a table is added, removed, or modified through the database.
+
+        :returns: The names of referenced tables, by table name
+        :rtype: dict
+        """
+        if self._fk_edges is None:
+            self._fk_edges = {}
+            for (table_name, table) in self.tables.items():
+                if table.constraints:
+                    self._fk_edges[table_name] = tuple(
+                        dict.fromkeys(constraint.foreign_table for constraint in table.constraints.values())
+                    )
+        return self._fk_edges
+
+    def strongly_connected_components(self, table_names=None):
+        """ Returns groups of tables which have mutually-dependent foreign keys
+
+        The graph of foreign keys between the given tables is split into strongly connected
+        components with (an iterative version of) Tarjan's algorithm.  Every table ends up in
+        exactly one component: a table which doesn't have a foreign key loop with any other table
+        is a component all by itself.  The components are returned in dependency order: the tables
+        in a component only reference tables in the same component or in earlier components.
+
+        Foreign keys that point to tables outside of table_names are ignored.
+
+        :param table_names: The names of the tables to check (defaults to all tables)
+        :type table_names: [string]|None
+        :returns: A list of components, each of which is a list of table names
+        :rtype: [[string]]
+        """
+        if table_names is None:
+            table_names = list(self._tables)
+
+        nodes = set(table_names)
+        fk_edges = self.fk_edges
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        components = []
+        for root in table_names:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(fk_edges.get(root, ())))]
+            while work:
+                (table_name, foreign_tables) = work[-1]
+                for foreign_table in foreign_tables:
+                    if foreign_table not in nodes:
+                        continue
+
+                    # first time we've seen this table: descend into it, and come back to
+                    # the rest of the foreign keys for the current table afterward
+                    if foreign_table not in index:
+                        index[foreign_table] = lowlink[foreign_table] = len(index)
+                        stack.append(foreign_table)
+                        on_stack.add(foreign_table)
+                        work.append((foreign_table, iter(fk_edges.get(foreign_table, ()))))
+                        break
+
+                    if foreign_table in on_stack:
+                        lowlink[table_name] = min(lowlink[table_name], index[foreign_table])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[table_name])
+
+                    if lowlink[table_name] == index[table_name]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == table_name:
+                                break
+                        component.reverse()
+                        components.append(component)
+
+        return components
+
     def store_rows_with_tables(self):
         """ Processes table rows and adds them to the appropriate tables
 
@@ -183,6 +276,20 @@ class database(object):
 
         return None
 
+    def clone_for_tracking(self):
+        """ Returns a copy of the database structure that can be modified without changing this one
+
+        Tables are copied with :meth:`mygrations.formats.mysql.definitions.table._shallow_tracking_copy`
+        so the column, key, and constraint definitions are shared with this database.  Rows and parsing
+        errors/warnings are not copied.
+
+        :returns: A copy of the database
+        :rtype: mygrations.formats.mysql.definitions.database
+        """
+        clone = database()
+        clone._tables = {name: table._shallow_tracking_copy() for (name, table) in self._tables.items()}
+        return clone
+
     def add_table(self, table):
         """ Adds a table to the database
 
@@ -193,6 +300,7 @@ class database(object):
             raise ValueError('Cannot add table %s to database because it already exists' % table.name)
 
         self._errors_1215 = None
+        self._fk_edges = None
         self._tables[table.name] = table
 
     def remove_table(self, table):
@@ -205,6 +313,7 @@ class database(object):
             raise ValueError('Cannot remove table %s from database because it does not exist' % table.name)
 
         self._errors_1215 = None
+        self._fk_edges = None
         self._tables.pop(table.name, None)
 
     def apply_operation(self, table_name, operation):
@@ -223,6 +332,7 @@ class database(object):
 
         # the table applies the operation
         self._errors_1215 = None
+        self._fk_edges = None
         self._tables[table_name].apply_operation(operation)
 
     def apply_to_source(self, operation):
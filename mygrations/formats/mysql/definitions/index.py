@@ -5,6 +5,7 @@ class index(object):
     _columns = None
     _errors = None
     _warnings = None
+    _str = None
 
     def __init__(self, name, columns, index_type='INDEX'):
         """ Index constructor
@@ -77,6 +78,9 @@ class index(object):
         :returns: A partial MySQL command that could be used to generate the column
         :rtype: string
         """
+        if self._str is not None:
+            return self._str
+
         parts = []
         if self.index_type == 'PRIMARY':
             parts.append('PRIMARY')
@@ -88,4 +92,5 @@ class index(object):
             parts.append('`%s`' % self.name)
         parts.append('(`%s`)' % ("`,`".join(self.columns)))
 
-        return ' '.join(parts)
+        self._str = ' '.join(parts)
+        return self._str
@@ -1,3 +1,4 @@
+import sys
 from collections import OrderedDict
 from .rows import rows as rows_definition
 
@@ -17,28 +18,29 @@ from ..mygrations.operations.row_insert import row_insert
 from ..mygrations.operations.row_update import row_update
 class table(object):
 
-    _name = ''
-    _options = None
-    _columns = None
-    _indexes = None
-    _constraints = None
-    _primary = None
-    _rows = None
-    _errors = None
-    _warnings = None
-    _auto_increment = 1
-    _indexed_columns = None
-    _tracking_rows = False
+    __slots__ = (
+        '_name', '_options', '_columns', '_indexes', '_constraints', '_primary', '_rows', '_errors', '_warnings',
+        '_auto_increment', '_indexed_columns', '_tracking_rows', '_column_positions', '_column_names',
+        '_fingerprint', '_create_cache'
+    )
 
     def __init__(self, name):
-        self._name = name
+        self._name = sys.intern(name)
         self._options = []
-        self._columns = OrderedDict()
-        self._indexes = OrderedDict()
-        self._constraints = OrderedDict()
+        self._columns = {}
+        self._indexes = {}
+        self._constraints = {}
         self._errors = []
         self._warnings = []
         self._primary = ''
+        self._rows = None
+        self._auto_increment = 1
+        self._indexed_columns = {}
+        self._tracking_rows = False
+        self._column_positions = None
+        self._column_names = None
+        self._fingerprint = None
+        self._create_cache = None
 
     @property
     def name(self):
@@ -88,22 +90,12 @@ class table(object):
 
         return self._tracking_rows
 
-    @property
-    def rows(self):
-        """ Public getter.  Returns an ordered dictionary of rows by id
-
-        :returns: Table rows
-        :rtype: OrderedDict
-        """
-
-        return self._rows
-
     @property
     def columns(self):
         """ Public getter.  Returns an ordered dictionary of table columns
 
         :returns: Table columns
-        :rtype: OrderedDict
+        :rtype: dict
         """
 
         return self._columns
@@ -113,7 +105,7 @@ class table(object):
         """ Public getter.  Returns an ordered dictionary of table indexes
 
         :returns: Table indexes
-        :rtype: OrderedDict
+        :rtype: dict
         """
 
         return self._indexes
@@ -123,7 +115,7 @@ class table(object):
         """ Public getter.  Returns an ordered dictionary of table constraints
 
         :returns: Table constraints
-        :rtype: OrderedDict
+        :rtype: dict
         """
 
         return self._constraints
@@ -145,7 +137,7 @@ class table(object):
         :returns: A list of parsing errors
         :rtype: list
         """
-        return [] if self._errors is None else self._errors
+        return self._errors
 
     @property
     def warnings(self):
@@ -154,7 +146,7 @@ class table(object):
         :returns: A list of parsing/table warnings
         :rtype: list
         """
-        return [] if self._warnings is None else self._warnings
+        return self._warnings
 
     @property
     def auto_increment(self):
@@ -204,31 +196,43 @@ class table(object):
             self._rows = OrderedDict()
 
         # the rows object may have a list of columns.  If not use our own list of columns
-        # remember that self._columns is an OrderedDict so converting its keys to a list
+        # remember that dictionaries preserve insertion order so converting its keys to a list
         # actually preserves the order (which is a requirement for us)
         columns = rows.columns if rows.num_explicit_columns else list(self._columns.keys())
 
-        for values in rows.raw_rows:
-            # rows without explicit columns must be checked for matching columns
-            if not rows.num_explicit_columns and len(values) != len(columns):
-                return 'Insert values has wrong number of values for table %s and row %s' % (self._name, values)
-
-            # we need to know the id of this record, which means we need
-            # to know where in the list of values the id column lives
-            try:
-                id_index = columns.index('id')
-                row_id = int(values[id_index])
-            except ValueError:
-                row_id = self._auto_increment
-
-            self._auto_increment = max(self._auto_increment, row_id + 1)
-            if row_id in self._rows:
-                return 'Duplicate row id found for table %s and row %s' % (self.name, values)
-
-            if not row_id:
-                return 'Invalid row id of %s found for table %s' % (row_id, self.name)
-
-            self._rows[row_id] = OrderedDict(zip(columns, values))
+        # rows without explicit columns must be checked for matching columns
+        check_length = not rows.num_explicit_columns
+        num_columns = len(columns)
+
+        # we need to know the id of each record, which means we need
+        # to know where in the list of values the id column lives
+        id_index = columns.index('id') if 'id' in columns else None
+
+        # track the auto increment locally and store it once at the end, rather than updating it for every row
+        auto_increment = self._auto_increment
+        try:
+            for values in rows.raw_rows:
+                if check_length and len(values) != num_columns:
+                    return 'Insert values has wrong number of values for table %s and row %s' % (self._name, values)
+
+                row_id = auto_increment
+                if id_index is not None:
+                    try:
+                        row_id = int(values[id_index])
+                    except ValueError:
+                        pass
+
+                if row_id >= auto_increment:
+                    auto_increment = row_id + 1
+                if not row_id:
+                    return 'Invalid row id of %s found for table %s' % (row_id, self.name)
+
+                # setdefault only stores the row if the id is new, which saves a second lookup
+                row = dict(zip(columns, values))
+                if self._rows.setdefault(row_id, row) is not row:
+                    return 'Duplicate row id found for table %s and row %s' % (self.name, values)
+        finally:
+            self._auto_increment = auto_increment
 
         return True
 
@@ -273,20 +277,23 @@ class table(object):
         :returns: The name of the column before the given column, or True if at the beginning
         :rtype: string|True
         """
-        # this works because we used an OrderedDict
-        columns = [col for col in self.columns.keys()]
+        # column positions are cached and only rebuilt when columns are added or removed, since
+        # this gets called once for every added column while diffing tables
+        if self._column_positions is None:
+            self._column_names = tuple(self._columns)
+            self._column_positions = {name: index for (index, name) in enumerate(self._column_names)}
 
-        if not column_name in columns:
+        if not column_name in self._column_positions:
             raise ValueError(
                 "Cannot return column before %s because %s does not exist in table %s" %
                 (column_name, column_name, self.name)
             )
 
-        index = columns.index(column_name)
+        index = self._column_positions[column_name]
         if index == 0:
             return True
 
-        return columns[index - 1]
+        return self._column_names[index - 1]
 
     def __str__(self):
         return str(self.create())
@@ -294,15 +301,74 @@ class table(object):
     def nice(self):
         return str(self.create(True))
 
-    def create(self, nice=False):
+    def create(self, nice=False, exclude_constraints=None):
         """ Returns a create table operation that can create this table
 
         :param nice: Whether or not to return a nicely formatted CREATE TABLE command
+        :param exclude_constraints: Names of constraints to leave out of the CREATE TABLE command
         :type nice: bool
+        :type exclude_constraints: set|None
         :returns: A create table operation
         :rtype: mygrations.operations.create_table
         """
-        return create_table(self, nice)
+        return create_table(self, nice, exclude_constraints)
+
+    def create_command(self, nice=False, exclude_constraints=None):
+        """ Returns the CREATE TABLE command for the current structure of the table
+
+        The command is cached until the structure of the table changes.
+
+        :param nice: Whether or not to return a nicely formatted CREATE TABLE command
+        :param exclude_constraints: Names of constraints to leave out of the CREATE TABLE command
+        :type nice: bool
+        :type exclude_constraints: set|None
+        :returns: A CREATE TABLE command
+        :rtype: string
+        """
+        key = (bool(nice), frozenset(exclude_constraints) if exclude_constraints else None)
+        if self._create_cache is None:
+            self._create_cache = {}
+        elif key in self._create_cache:
+            return self._create_cache[key]
+
+        newline = '\n' if nice else ''
+        padding = '  ' if nice else ''
+        exclude_constraints = key[1] or ()
+        body = ['%s%s' % (padding, str(column)) for column in self._columns.values()]
+        body.extend(['%s%s' % (padding, str(index)) for index in self._indexes.values()])
+        body.extend([
+            '%s%s' % (padding, str(constraint))
+            for (name, constraint) in self._constraints.items()
+            if name not in exclude_constraints
+        ])
+        options = ['%s=%s' % (opt.name, opt.value) for opt in self._options]
+        if options:
+            options = ' %s' % ' '.join(options)
+        else:
+            options = ''
+
+        command = 'CREATE TABLE `%s` (%s%s%s)%s;' % (self._name, newline, ",\n".join(body), newline, options)
+        self._create_cache[key] = command
+        return command
+
+    def fingerprint(self):
+        """ Returns a summary of the table structure which can be compared against other tables
+
+        Two tables with equal fingerprints have the same columns, indexes, and constraints
+        (in the same order), so there are no structural differences between them.  The
+        fingerprint is cached until the structure of the table changes.
+
+        :returns: A comparable summary of the table structure
+        :rtype: tuple
+        """
+        if self._fingerprint is None:
+            self._fingerprint = (
+                tuple(self._columns), tuple(str(column) for column in self._columns.values()),
+                tuple(self._indexes), tuple(str(index) for index in self._indexes.values()),
+                tuple(self._constraints), tuple(str(constraint) for constraint in self._constraints.values())
+            )
+
+        return self._fingerprint
 
     def to(self, comparison_table, split_operations=False):
         """ Compares two tables to eachother and returns a list of operations which can bring the structure of the second in line with the first
@@ -330,11 +396,9 @@ class table(object):
         :returns: A list of operations to apply to table
         :rtype: list[mygrations.formats.mysql.mygrations.operations.*] | dict
         """
-        # start with the columns, obviously
-        (added_columns, removed_columns, overlap_columns) = self._differences(self.columns, comparison_table.columns)
-        (added_keys, removed_keys, overlap_keys) = self._differences(self.indexes, comparison_table.indexes)
-        (added_constraints, removed_constraints,
-         overlap_constraints) = self._differences(self.constraints, comparison_table.constraints)
+        # most tables don't change between the two databases, in which case there is nothing to do
+        if self.fingerprint() == comparison_table.fingerprint():
+            return {} if split_operations else []
 
         # keeping in mind the overall algorithm, we're going to separate out all changes into three alter statments
         # these are broken up according to the way that the system has to process them to make sure that foreign
@@ -342,76 +406,109 @@ class table(object):
         # 1. Adding columns, changing columns, adding keys, changing keys, removing keys, removing foreign keys
         # 2. Adding foreign keys, changing foreign keys
         # 3. Removing columns
-        primary_alter = alter_table(self.name)
+        primary_alter = alter_table(self._name)
+        removed_constraints_alter = alter_table(self._name)
+        constraints = alter_table(self._name)
+        alters = {'kitchen_sink': primary_alter, 'removed_fks': removed_constraints_alter, 'fks': constraints}
+        for (category, operation) in self._iter_operations(comparison_table):
+            alters[category].add_operation(operation)
+
+        # now put it all together
+        if split_operations:
+            operations = {}
+            if removed_constraints_alter:
+                operations['removed_fks'] = removed_constraints_alter
+            if primary_alter:
+                operations['kitchen_sink'] = primary_alter
+            if constraints:
+                operations['fks'] = constraints
+        else:
+            operations = []
+            primary_alter.extend_operations(constraints)
+            if removed_constraints_alter:
+                operations.append(removed_constraints_alter)
+            if primary_alter:
+                operations.append(primary_alter)
+
+        return operations
+
+    def _iter_operations(self, comparison_table):
+        """ Yields the operations needed to bring the structure of this table in line with comparison_table
+
+        Operations are yielded as (category, operation) tuples, where category is one of
+        'kitchen_sink', 'removed_fks', or 'fks'.  See self.to() for what the categories mean.
+        Operations are yielded in order within each category.
+
+        :param comparison_table: A table to find differences with
+        :type comparison_table: mygrations.formats.mysql.definitions.table
+        :returns: A generator of (category, operation) tuples
+        :rtype: generator
+        """
+        # these get hit repeatedly in the loops below, so skip the property lookups
+        from_columns = self._columns
+        to_columns = comparison_table._columns
+        from_indexes = self._indexes
+        to_indexes = comparison_table._indexes
+        from_constraints = self._constraints
+        to_constraints = comparison_table._constraints
+
+        # start with the columns, obviously
+        (added_columns, removed_columns, overlap_columns) = self._differences(from_columns, to_columns)
+        (added_keys, removed_keys, overlap_keys) = self._differences(from_indexes, to_indexes)
+        (added_constraints, removed_constraints,
+         overlap_constraints) = self._differences(from_constraints, to_constraints)
+
         for new_column in added_columns:
-            primary_alter.add_operation(
-                add_column(comparison_table.columns[new_column], comparison_table.column_before(new_column))
-            )
+            yield ('kitchen_sink', add_column(to_columns[new_column], comparison_table.column_before(new_column)))
 
         for overlap_column in overlap_columns:
+            from_column = from_columns[overlap_column]
+            to_column = to_columns[overlap_column]
+
             # it's really easy to tell if a column changed
-            if str(self.columns[overlap_column]) == str(comparison_table.columns[overlap_column]):
+            if str(from_column) == str(to_column):
                 continue
 
             # FALSE POSITIVE CHECK:
             # if one column has collate/character set and the other doesn't, and that is the only difference,
             # then ignore this difference
-            if self.columns[overlap_column].is_really_the_same_as(comparison_table.columns[overlap_column]):
+            if from_column.is_really_the_same_as(to_column):
                 continue
 
-            primary_alter.add_operation(change_column(comparison_table.columns[overlap_column]))
+            yield ('kitchen_sink', change_column(to_column))
 
         for removed_column in removed_columns:
-            primary_alter.add_operation(remove_column(self.columns[removed_column]))
+            yield ('kitchen_sink', remove_column(from_columns[removed_column]))
 
         # indexes also go in that first alter table
         for new_key in added_keys:
-            primary_alter.add_operation(add_key(comparison_table.indexes[new_key]))
+            yield ('kitchen_sink', add_key(to_indexes[new_key]))
         for removed_key in removed_keys:
-            primary_alter.add_operation(remove_key(self.indexes[removed_key]))
+            yield ('kitchen_sink', remove_key(from_indexes[removed_key]))
         for overlap_key in overlap_keys:
-            if str(self.indexes[overlap_key]) == str(comparison_table.indexes[overlap_key]):
+            to_key = to_indexes[overlap_key]
+            if str(from_indexes[overlap_key]) == str(to_key):
                 continue
-            primary_alter.add_operation(change_key(comparison_table.indexes[overlap_key]))
+            yield ('kitchen_sink', change_key(to_key))
 
         # removed foreign key constraints get their own alter because that should always happen first
-        removed_constraints_alter = alter_table(self.name)
         for removed_constraint in removed_constraints:
-            removed_constraints_alter.add_operation(remove_constraint(self.constraints[removed_constraint]))
+            yield ('removed_fks', remove_constraint(from_constraints[removed_constraint]))
 
         # adding/changing/removing foreign keys gets their own alter
-        constraints = alter_table(self.name)
         for added_constraint in added_constraints:
-            constraints.add_operation(add_constraint(comparison_table.constraints[added_constraint]))
+            yield ('fks', add_constraint(to_constraints[added_constraint]))
         for overlap_constraint in overlap_constraints:
-            if str(self.constraints[overlap_constraint]) == str(comparison_table.constraints[overlap_constraint]):
+            from_constraint = from_constraints[overlap_constraint]
+            to_constraint = to_constraints[overlap_constraint]
+            if str(from_constraint) == str(to_constraint):
                 continue
 
             # foreign key constraints are modified by first dropping the constraint and
             # then adding the new one.  However, these two operations cannot happen in the
             # same alter command.  Kinda a pain.  Oh well.
-            removed_constraints_alter.add_operation(remove_constraint(self.constraints[overlap_constraint]))
-            constraints.add_operation(add_constraint(comparison_table.constraints[overlap_constraint]))
-
-        # now put it all together
-        if split_operations:
-            operations = {}
-            if removed_constraints_alter:
-                operations['removed_fks'] = removed_constraints_alter
-            if primary_alter:
-                operations['kitchen_sink'] = primary_alter
-            if constraints:
-                operations['fks'] = constraints
-        else:
-            operations = []
-            for operation in constraints:
-                primary_alter.add_operation(operation)
-            if removed_constraints_alter:
-                operations.append(removed_constraints_alter)
-            if primary_alter:
-                operations.append(primary_alter)
-
-        return operations
+            yield ('removed_fks', remove_constraint(from_constraint))
+            yield ('fks', add_constraint(to_constraint))
 
     def to_rows(self, from_table=None):
         """ Compares two tables to eachother and returns a list of operations which can bring the rows of this table in line with the other
@@ -432,26 +529,33 @@ class table(object):
                 % (self.name)
             )
 
-        (inserted_ids, deleted_ids, updated_ids) = self._differences(from_table.rows if from_table else {}, self.rows)
+        # bind these once: the property lookups add up over large sets of rows
+        name = self._name
+        to_rows = self.rows
+        from_rows = from_table.rows if from_table else {}
+        (inserted_ids, deleted_ids, updated_ids) = self._differences(from_rows, to_rows)
 
         operations = []
         for row_id in inserted_ids:
-            operations.append(row_insert(self.name, self.rows[row_id]))
+            operations.append(row_insert(name, to_rows[row_id]))
 
         for row_id in deleted_ids:
-            operations.append(row_delete(self.name, row_id))
+            operations.append(row_delete(name, row_id))
 
         for row_id in updated_ids:
+            to_row = to_rows[row_id]
+            from_row = from_rows[row_id]
+
             # try to be smart and not update if we don't have to
-            (inserted_cols, deleted_cols, updated_cols) = self._differences(self.rows[row_id], from_table.rows[row_id])
+            (inserted_cols, deleted_cols, updated_cols) = self._differences(to_row, from_row)
             differences = False
             for col in updated_cols:
-                if not self._loose_equal(self.rows[row_id][col], from_table.rows[row_id][col]):
+                if not self._loose_equal(to_row[col], from_row[col]):
                     differences = True
                     break
 
             if differences:
-                operations.append(row_update(self.name, self.rows[row_id]))
+                operations.append(row_update(name, to_row))
 
         return operations
 
@@ -461,32 +565,99 @@ class table(object):
         :param column: The column to check
         :type column: string|mygrations.formats.mysql.definitions.column
         """
-        if type(column) != str:
+        if not isinstance(column, str):
             column = column.name
 
         if column not in self._columns:
             return False
 
-        # best way to do this is with a set.  We'll keep a record of all indexed columns
-        # the column is indexed if an index has that column in the first position
-        if self._indexed_columns is None:
-            self._indexed_columns = set([index.columns[0] for index in self._indexes.values()])
-
+        # We keep a record of all indexed columns as keys are added/removed: the
+        # column is indexed if an index has that column in the first position
         return column in self._indexed_columns
 
+    def _rebuild_indexed_columns(self):
+        """ Rebuilds the record of indexed columns from scratch
+
+        self._indexed_columns is a dictionary where the keys are the names of indexed columns and the
+        values are the set of names of the indexes which have that column in the first position.  Keeping
+        the index names around means that we don't forget a column is indexed when one of multiple
+        indexes on it is removed.
+        """
+        self._indexed_columns = {}
+        for (index_name, index) in self._indexes.items():
+            if index.columns:
+                self._indexed_columns.setdefault(index.columns[0], set()).add(index_name)
+
+    def _track_indexed_column(self, key):
+        """ Records the first column of the given key as indexed
+
+        :param key: The key that was added to the table
+        :type key: mygrations.formats.mysql.definitions.key
+        """
+        self._indexed_columns.setdefault(key.columns[0], set()).add(key.name)
+
+    def _untrack_indexed_column(self, key):
+        """ Forgets that the given key indexes its first column
+
+        The column stays indexed if another index still has it in the first position
+
+        :param key: The key that was removed from the table
+        :type key: mygrations.formats.mysql.definitions.key
+        """
+        column = key.columns[0]
+        index_names = self._indexed_columns.get(column)
+        if index_names is None:
+            return
+
+        index_names.discard(key.name)
+        if not index_names:
+            del self._indexed_columns[column]
+
     def _differences(self, from_list, to_list):
         """
-        Calculates the difference between two OrderedDicts.
+        Calculates the difference between two ordered dictionaries.
 
         https://codereview.stackexchange.com/a/176303/140581
 
-        :param from_list: OrderedDict
-        :param to_list: OrderedDict
+        :param from_list: dict
+        :param to_list: dict
         :return: (added, removed, overlap)
         """
-
-        return ([key for key in to_list if key not in from_list], [key for key in from_list if key not in to_list],
-                [key for key in from_list if key in to_list])
+        # removed and overlap come out of a single pass over from_list.  Order matters
+        # (it determines the order of the generated operations) so stick to lists
+        removed = []
+        overlap = []
+        for key in from_list:
+            if key in to_list:
+                overlap.append(key)
+            else:
+                removed.append(key)
+
+        return ([key for key in to_list if key not in from_list], removed, overlap)
+
+    def _shallow_tracking_copy(self):
+        """ Returns a copy of the table that can be modified without changing this one
+
+        Used by mygrations to keep track of the state of a database as operations are applied.
+        Operations only ever add, remove, or replace column/key/constraint definitions (they never
+        modify the definitions themselves), so only the containers are copied and the definitions
+        are shared.  This is much cheaper than a deepcopy.
+
+        :returns: A copy of the table
+        :rtype: mygrations.formats.mysql.definitions.table
+        """
+        copy = table(self._name)
+        copy._options = list(self._options)
+        copy._columns = dict(self._columns)
+        copy._indexes = dict(self._indexes)
+        copy._constraints = dict(self._constraints)
+        copy._primary = self._primary
+        copy._rows = None if self._rows is None else OrderedDict(self._rows)
+        copy._auto_increment = self._auto_increment
+        copy._tracking_rows = self._tracking_rows
+        copy._indexed_columns = {column: set(names) for (column, names) in self._indexed_columns.items()}
+        copy._fingerprint = self._fingerprint
+        return copy
 
     def apply_operation(self, operation):
         """
@@ -497,6 +668,79 @@ class table(object):
         """
         operation.apply_to_table(self)
 
+    def _add(self, storage, kind, definition):
+        """ Adds a column, key, or constraint definition to the given storage dictionary
+
+        :param storage: The dictionary to add the definition to (self._columns, self._indexes, or self._constraints)
+        :param kind: The kind of definition, for error messages
+        :param definition: The definition to add
+        :type storage: dict
+        :type kind: string
+        :type definition: mygrations.formats.mysql.definitions.column|index|constraint
+        :returns: The (interned) name the definition was stored under
+        :rtype: string
+        """
+        if definition.name in storage:
+            raise ValueError(
+                "Cannot add %s %s because %s %s already exists" % (kind, definition.name, kind, definition.name)
+            )
+
+        # names are interned so that lookups between tables can usually match on identity
+        name = sys.intern(definition.name)
+        storage[name] = definition
+        self._fingerprint = None
+        self._create_cache = None
+        return name
+
+    def _remove(self, storage, kind, name):
+        """ Removes a column, key, or constraint definition from the given storage dictionary
+
+        :param storage: The dictionary to remove the definition from
+        :param kind: The kind of definition, for error messages
+        :param name: The definition (or name of the definition) to remove
+        :type storage: dict
+        :type kind: string
+        :type name: string|mygrations.formats.mysql.definitions.column|index|constraint
+        :returns: The removed definition
+        :rtype: mygrations.formats.mysql.definitions.column|index|constraint
+        """
+        if not isinstance(name, str):
+            name = name.name
+
+        try:
+            definition = storage.pop(name)
+        except KeyError:
+            raise ValueError("Cannot remove %s %s because %s %s does not exist" % (kind, name, kind, name))
+
+        self._fingerprint = None
+        self._create_cache = None
+        return definition
+
+    def _change(self, storage, kind, definition):
+        """ Replaces a column, key, or constraint definition in the given storage dictionary
+
+        This does not currently support renaming
+
+        :param storage: The dictionary to change the definition in
+        :param kind: The kind of definition, for error messages
+        :param definition: The new definition
+        :type storage: dict
+        :type kind: string
+        :type definition: mygrations.formats.mysql.definitions.column|index|constraint
+        :returns: The old definition
+        :rtype: mygrations.formats.mysql.definitions.column|index|constraint
+        """
+        if definition.name not in storage:
+            raise ValueError(
+                "Cannot modify %s %s because %s %s does not exist" % (kind, definition.name, kind, definition.name)
+            )
+
+        old_definition = storage[definition.name]
+        storage[definition.name] = definition
+        self._fingerprint = None
+        self._create_cache = None
+        return old_definition
+
     def add_column(self, column, position=False):
         """ Adds a column to the table
 
@@ -507,35 +751,26 @@ class table(object):
         :type column: mygrations.formats.mysql.definitions.column
         :type position: See mygrations.formats.mysql.mygration.operations.add_column
         """
-        # putting it at the end is easy
-        if column.name in self._columns:
-            raise ValueError("Cannot add column %s because %s already exists" % (column.name, column.name))
+        if position and position != True and position not in self._columns:
+            raise ValueError(
+                "Cannot add column %s after %s because %s does not exist" % (column.name, position, position)
+            )
 
-        if not position:
-            self._columns[column.name] = column
-            return True
+        # the new column always goes on the end first
+        self._add(self._columns, 'column', column)
+        self._column_positions = None
 
-        # end is also easy
-        if position == True:
-            self._columns[column.name] = column
-            self._columns.move_to_end(column.name, last=False)
+        # putting it at the end is easy
+        if not position:
             return True
 
-        # now it is tricky
-        found = False
-        new_columns = OrderedDict()
-        for key, value in self._columns.items():
-            new_columns[key] = value
-            if key == position:
-                new_columns[column.name] = column
-                found = True
-
-        if not found:
-            raise ValueError(
-                "Cannot add column %s after %s because %s does not exist" % (column.name, position, position)
-            )
+        # otherwise, rather than rebuilding the whole dictionary, move everything that should
+        # come after the new column back to the end, behind it.  For the beginning that is everything
+        names = list(self._columns)
+        trailing = names[:-1] if position == True else names[names.index(position) + 1:-1]
+        for key in trailing:
+            self._columns[key] = self._columns.pop(key)
 
-        self._columns = new_columns
         return True
 
     def remove_column(self, column_name):
@@ -544,13 +779,8 @@ class table(object):
         :param column_name: The column to remove
         :type column_name: string|mygrations.formats.mysql.definitions.column
         """
-        if type(column_name) != str:
-            column_name = column_name.name
-
-        if not column_name in self._columns:
-            raise ValueError("Cannot remove column %s because column %s does not exist" % (column_name, column_name))
-
-        self._columns.pop(column_name, None)
+        self._remove(self._columns, 'column', column_name)
+        self._column_positions = None
 
     def change_column(self, new_column):
         """ Changes a column
@@ -560,11 +790,7 @@ class table(object):
         :param new_column: The new column definition
         :type new_column: mygrations.formats.mysql.definitions.column
         """
-        if not new_column.name in self._columns:
-            raise ValueError(
-                "Cannot modify column %s because column %s does not exist" % (new_column.name, new_column.name)
-            )
-        self._columns[new_column.name] = new_column
+        self._change(self._columns, 'column', new_column)
 
     def add_key(self, key):
         """ Adds an key to the table
@@ -572,12 +798,8 @@ class table(object):
         :param key: The key to add
         :type key: mygrations.formats.mysql.definitions.key
         """
-        if key.name in self._indexes:
-            raise ValueError("Cannot add key %s because key %s already exists" % (key.name, key.name))
-        self._indexes[key.name] = key
-
-        if self._indexed_columns is not None:
-            self._indexed_columns.add(key.columns[0])
+        self._add(self._indexes, 'key', key)
+        self._track_indexed_column(key)
 
     def remove_key(self, key):
         """ Removes an key from the table
@@ -585,17 +807,7 @@ class table(object):
         :param key: The key to remove
         :type key: string|mygrations.formats.mysql.definitions.key
         """
-        if type(key) != str:
-            key = key.name
-
-        if key not in self._indexes:
-            raise ValueError("Cannot remove key %s because key %s does not exist" % (key, key))
-
-        indexed_column = self._indexes[key].columns[0]
-        self._indexes.pop(key, None)
-
-        if self._indexed_columns is not None:
-            self._indexed_columns.discard(indexed_column)
+        self._untrack_indexed_column(self._remove(self._indexes, 'key', key))
 
     def change_key(self, new_key):
         """ Changes a key
@@ -605,16 +817,8 @@ class table(object):
         :param new_key: The new key definition
         :type new_key: mygrations.formats.mysql.definitions.key
         """
-        if not new_key.name in self._indexes:
-            raise ValueError("Cannot modify key %s because key %s does not exist" % (new_key.name, new_key.name))
-
-        if self._indexed_columns is not None:
-            self._indexed_columns.discard(self._indexes[new_key.name].columns[0])
-
-        self._indexes[new_key.name] = new_key
-
-        if self._indexed_columns is not None:
-            self._indexed_columns.add(new_key.columns[0])
+        self._untrack_indexed_column(self._change(self._indexes, 'key', new_key))
+        self._track_indexed_column(new_key)
 
     def add_constraint(self, constraint):
         """ Adds a constraint to the table
@@ -622,11 +826,7 @@ class table(object):
         :param constraint: The constraint to add
         :type constraint: mygrations.formats.mysql.definitions.constraint
         """
-        if constraint.name in self._constraints:
-            raise ValueError(
-                "Cannot add constraint %s because constraint %s already exists" % (constraint.name, constraint.name)
-            )
-        self._constraints[constraint.name] = constraint
+        self._add(self._constraints, 'constraint', constraint)
 
     def remove_constraint(self, constraint):
         """ Removes an constraint from the table
@@ -634,14 +834,7 @@ class table(object):
         :param constraint: The constraint to remove
         :type constraint: string|mygrations.formats.mysql.definitions.constraint
         """
-        if type(constraint) != str:
-            constraint = constraint.name
-
-        if constraint not in self._constraints:
-            raise ValueError(
-                "Cannot remove constraint %s because constraint %s does not exist" % (constraint, constraint)
-            )
-        self._constraints.pop(constraint, None)
+        self._remove(self._constraints, 'constraint', constraint)
 
     def change_constraint(self, new_constraint):
         """ Changes a constraint
@@ -651,12 +844,7 @@ class table(object):
         :param new_constraint: The new constraint definition
         :type new_constraint: mygrations.formats.mysql.definitions.constraint
         """
-        if not new_constraint.name in self._constraints:
-            raise ValueError(
-                "Cannot modify constraint %s because constraint %s does not exist" %
-                (new_constraint.name, new_constraint.name)
-            )
-        self._constraints[new_constraint.name] = new_constraint
+        self._change(self._constraints, 'constraint', new_constraint)
 
     def _loose_equal(self, val1, val2):
         """ Performs a looser comparison, as values might have different types depending on whether they came out of a database or file
@@ -1,4 +1,4 @@
-from collections import OrderedDict
+import sys
 
 from mygrations.core.parse.parser import parser
 from mygrations.formats.mysql.definitions.constraint import constraint
@@ -56,27 +56,27 @@ class create_parser(parser, table):
                  'name': 'closing_semicolon'
              }]
 
+    def __init__(self, rules=[]):
+        parser.__init__(self, rules)
+
+        # the table state has to exist even if the CREATE TABLE command doesn't parse
+        table.__init__(self, '')
+
     def process(self):
 
         self.semicolon = True if 'closing_semicolon' in self._values else False
-        self._name = self._values['name'].strip('`')
+        self._name = sys.intern(self._values['name'].strip('`'))
         self._definitions = self._values['definitions']
         self._options = self._values['table_options'] if 'table_options' in self._values else []
-        self._columns = OrderedDict()
-        self._indexes = OrderedDict()
-        self._constraints = OrderedDict()
-        self._errors = []
-        self._warnings = []
-        self._primary = ''
 
         # ignore the AUTO_INCREMENT option: there is no reason for us to ever manage that
         self._options = [opt for opt in self._options if opt.name != 'AUTO_INCREMENT']
 
         for definition in self._definitions:
             if isinstance(definition, column):
-                self._columns[definition.name] = definition
+                self._columns[sys.intern(definition.name)] = definition
             elif isinstance(definition, index):
-                self._indexes[definition.name] = definition
+                self._indexes[sys.intern(definition.name)] = definition
 
                 if definition.index_type == 'PRIMARY':
                     if self._primary:
@@ -84,7 +84,7 @@ class create_parser(parser, table):
                     else:
                         self._primary = definition
             elif isinstance(definition, constraint):
-                self._constraints[definition.name] = definition
+                self._constraints[sys.intern(definition.name)] = definition
 
             if definition.errors:
                 for error in definition.errors:
@@ -94,6 +94,9 @@ class create_parser(parser, table):
                 for warning in definition.warnings:
                     self._warnings.append('%s in table %s' % (warning, self._name))
 
+        self._rebuild_indexed_columns()
+        self._create_cache = None
+
         if not self._name:
             self._errors.append('Table name is required')
 
@@ -1,4 +1,4 @@
-import copy
+from collections import deque
 
 from mygrations.formats.mysql.definitions.database import database
 from mygrations.formats.mysql.mygrations.operations.alter_table import alter_table
@@ -29,6 +29,8 @@ class mygration:
     8. Remove any tables that need to be removed
     """
 
+    __slots__ = ('db_to', 'db_from', '_disable_fk_checks', '_errors_1215', '_operations', '_str')
+
     def __init__(self, db_to, db_from=None, disable_checks=True):
         """ Create a migration plan
 
@@ -43,16 +45,15 @@ class mygration:
         self.db_to = db_to
         self.db_from = db_from
         self._disable_fk_checks = disable_checks
+        self._str = None
 
         # first things first: stop if we have any FK errors in the database
         # we are migrating to
         self._errors_1215 = []
         self._errors_1215 = self.db_to.errors_1215
 
-        if not self._errors_1215:
-            self._operations = self._process()
-        else:
-            self._operations = None
+        # the operations themselves are only figured out when they are needed
+        self._operations = None
 
     @property
     def operations(self):
@@ -70,6 +71,8 @@ class mygration:
         :returns: A list of table operations
         :rtype: None|[mygrations.formats.mysql.mygrations.operations.operation]
         """
+        if self._operations is None and not self._errors_1215:
+            self._operations = list(self._iter_operations())
         return self._operations
 
     @property
@@ -82,16 +85,22 @@ class mygration:
         return self._errors_1215
 
     def __len__(self):
-        return len(self._operations)
+        return len(self.operations)
 
     def __bool__(self):
-        return True if len(self._operations) else False
+        return True if len(self.operations) else False
 
     def __str__(self):
-        return "\n".join([str(x) for x in self._operations])
+        # the operations don't change once they have been calculated
+        if self._str is None:
+            self._str = "\n".join(str(x) for x in self.operations)
+        return self._str
 
     def __iter__(self):
-        return self._operations.__iter__()
+        # if nobody has asked for the list of operations then there is no need to build it
+        if self._operations is None and not self._errors_1215:
+            return self._iter_operations()
+        return self.operations.__iter__()
 
     def _differences(self, from_dict, to_dict):
         """
@@ -106,44 +115,50 @@ class mygration:
         :return: (added, removed, overlap)
         """
 
-        return ([key for key in to_dict if key not in from_dict], [key for key in from_dict if key not in to_dict],
-                [key for key in from_dict if key in to_dict])
+        # removed and overlap come out of a single pass over from_dict.  Order matters
+        # (it determines the order of the generated operations) so no set operations
+        removed = []
+        overlap = []
+        for key in from_dict:
+            if key in to_dict:
+                overlap.append(key)
+            else:
+                removed.append(key)
+
+        return ([key for key in to_dict if key not in from_dict], removed, overlap)
 
-    def _process(self):
+    def _iter_operations(self):
         """ Figures out the operations needed to get to self.db_to
 
-        Returns a list of operations that will migrate db_from to db_to
+        Yields the operations that will migrate db_from to db_to, in order
 
         For performance reasons the migrations are done with foreign key
         checks off: the first operation turns them off, and the last operation
         turns them on.
 
         :return: Operations needed to complete the migration
-        :rtype: [mygrations.formats.mysql.mygrations.operations]
+        :rtype: generator
         """
-        operations = []
         if self._disable_fk_checks:
-            operations.append(disable_checks())
+            yield disable_checks()
 
         # what tables have been added/changed/removed
         db_from_tables = self.db_from.tables if self.db_from else {}
         (tables_to_add, tables_to_remove, tables_to_update) = self._differences(db_from_tables, self.db_to.tables)
 
         for table_name in tables_to_add:
-            operations.append(self.db_to.tables[table_name].create())
+            yield self.db_to.tables[table_name].create()
 
         for table_name in tables_to_update:
             target_table = self.db_to.tables[table_name]
             source_table = self.db_from.tables[table_name]
-            operations.extend(source_table.to(target_table))
+            yield from source_table.to(target_table)
 
         for table_name in tables_to_remove:
-            operations.append(remove_table(table_name))
+            yield remove_table(table_name)
 
         if self._disable_fk_checks:
-            operations.append(enable_checks())
-
-        return operations
+            yield enable_checks()
 
     def _old_process(self):
         """ Figures out the operations (and proper order) need to get to self.db_to
@@ -170,7 +185,7 @@ class mygration:
         # Our primary output is a list of operations, but there is more that we need
         # to make all of this happen.  We need a database to keep track of the
         # state of the database we are building after each operation is "applied"
-        tracking_db = copy.deepcopy(self.db_from) if self.db_from else database()
+        tracking_db = self.db_from.clone_for_tracking() if self.db_from else database()
 
         # a little bit of extra processing will simplify our algorithm by a good chunk.
         # The situation is much more complicated when we have a database we are migrating
@@ -185,11 +200,12 @@ class mygration:
         # then just quit now before we do anything.  If they are all fulfilled then we
         # know our final table will be fine, so if we can just split off any uncertain
         # foreign key constraints and apply them all at the end when our database is done
-        # being updated.  Simple(ish)!
-        #if self.db_from:
-        #check = mygration( self.db_to )
-        #if check.errors_1215:
-        #return [ check.errors_1215, [] ]
+        # being updated.  Simple(ish)!  We don't actually need a whole second mygration
+        # for that though: the database already knows how to check its own foreign keys,
+        # and caches the result until one of its tables changes.  If there are any errors
+        # then there is nothing we can do, so there are no operations to return.
+        if self.db_from and self.db_to.errors_1215:
+            return []
 
         # First figure out the status of individual tables
         db_from_tables = self.db_from.tables if self.db_from else {}
@@ -218,37 +234,27 @@ class mygration:
         if split_operations['fks']:
             fk_operations.extend(split_operations['fks'])
 
-        # now that we got some tables modified let's try adding tables again
-        # if we have any left.  Remember that tracking_db and tables_to_add
-        # are modified in-place.  The point here is that there may be some
-        # tables to add that we were not able to add before because they
-        # relied on adding a column to a table before a foreign key could
-        # be supported.
-        if tables_to_add:
-            (errors_1215, more_operations) = self._process_adds(tracking_db, tables_to_add)
-            if more_operations:
-                operations = operations.extend(more_operations)
-            if errors_1215:
-                if fk_operations:
-                    operations.extend(fk_operations)
-                return operations
-
-        # At this point in time if we still have tables to add it is because
-        # they have mutually-dependent foreign key constraints.  The way to
-        # fix that is to be a bit smarter (but not too smart) and remove
-        # from the tables all foreign key constraints that can't be added yet.
-        # Then run the CREATE TABLE operations, and add the foreign key
-        # constraints afterward
-        for table_to_add in tables_to_add:
-            new_table = self.db_to.tables[table_to_add]
-            bad_constraints = tracking_db.unfulfilled_fks(new_table)
-            new_table_copy = copy.deepcopy(new_table)
-            create_fks = alter_table(table_to_add)
-            for constraint in bad_constraints.values():
-                create_fks.add_operation(add_constraint(constraint['foreign_key']))
-                new_table_copy.remove_constraint(constraint['foreign_key'])
-            operations.append(new_table_copy.create())
-            fk_operations.append(create_fks)
+        # now that we got some tables modified we can add the rest of the tables.  Remember
+        # that tracking_db and tables_to_add are modified in-place.  Anything left over
+        # either relied on a table modification (adding a column, for instance) before a
+        # foreign key could be supported, or has mutually-dependent foreign key constraints
+        # with other tables (possibly indirectly).  Rather than re-trying until nothing
+        # changes, find the groups of mutually-dependent tables (strongly connected
+        # components) up front: they come back in order, such that every group only depends
+        # on groups that come before it.  Add the tables in that order, and if a table still
+        # has foreign keys that can't be fulfilled yet (because they point to a table later
+        # in its own group) then create the table without them and add them afterward
+        for component in self.db_to.strongly_connected_components(tables_to_add):
+            for table_to_add in component:
+                new_table = self.db_to.tables[table_to_add]
+                bad_constraints = tracking_db.unfulfilled_fks(new_table)
+                if bad_constraints:
+                    create_fks = alter_table(table_to_add)
+                    for constraint in bad_constraints.values():
+                        create_fks.add_operation(add_constraint(constraint['foreign_key']))
+                    fk_operations.append(create_fks)
+                operations.append(new_table.create(exclude_constraints=set(bad_constraints)))
+                tracking_db.add_table(new_table)
 
         # process any remaining foreign key constraints
         if fk_operations:
@@ -257,7 +263,7 @@ class mygration:
         # finally remove any tables
         for table_to_remove in tables_to_remove:
             operations.append(remove_table(table_to_remove))
-            tracking_db.remove_table(table_to_remove)
+            tracking_db.remove_table(tracking_db.tables[table_to_remove])
 
         # all done!!!
         return operations
@@ -267,53 +273,79 @@ class mygration:
 
         tracking_db and tables_to_add are passed in by reference and modified
 
+        Tables are added in topological order (Kahn's algorithm) over the graph of foreign keys
+        between the tables being added, so each table is checked once it has a chance of being
+        addable, rather than re-checking every table until nothing changes.  Any tables left over
+        either have mutually-dependent foreign key constraints or are waiting on changes to existing
+        tables, and are left in tables_to_add.
+
         :returns: A list of 1215 error messages and a list of mygration operations
         :rtype: ( [{'error': string, 'foreign_key': mygrations.formats.mysql.definitions.constraint}], [mygrations.formats.mysql.mygrations.operations.operation] )
         """
         errors_1215 = []
         operations = []
-        good_tables = {}
-
-        # keep looping through tables as long as we find some to process
-        # the while loop will stop under two conditions: if all tables
-        # are processed or if we stop adding tables, which happens if we
-        # have tables with mutualy-dependent foreign key constraints
-        last_number_to_add = 0
-        while tables_to_add and len(tables_to_add) != last_number_to_add:
-            last_number_to_add = len(tables_to_add)
-            for new_table_name in tables_to_add:
-                new_table = self.db_to.tables[new_table_name]
-                bad_constraints = tracking_db.unfulfilled_fks(new_table)
-
-                # if we found no problems then we can add this table to our
-                # tracking db and add the "CREATE TABLE" operation to our list of operations
-                if not bad_constraints:
-                    tables_to_add.remove(new_table_name)
-                    operations.append(new_table.create())
-                    tracking_db.add_table(new_table)
-                    continue
 
-                # the next question is whether this is a valid constraint
-                # that simply can't be added yet (because it has dependencies
-                # that have not been added) or if there is an actual problem
-                # with the constraint.
-                if new_table_name in good_tables:
+        # build the dependency graph: for each table, the set of tables being added that its foreign
+        # keys reference (unless the tracking db already has them), and the reverse: for each table,
+        # the tables that are waiting on it.  The references come from the foreign key edges that
+        # the database we are migrating to keeps, so the constraints aren't walked here.
+        pending = set(tables_to_add)
+        fk_edges = self.db_to.fk_edges
+        missing = {}
+        waiting_on = {}
+        for new_table_name in tables_to_add:
+            missing[new_table_name] = set()
+            for foreign_table in fk_edges.get(new_table_name, ()):
+                if foreign_table == new_table_name or foreign_table not in pending:
                     continue
-
-                # If we are here we have to decide if this table is fulfillable
-                # eventually, or if there is a mistake with a foreign key that
-                # we can't fix.  To tell the difference we just check if the
-                # database we are migrating to can fulfill these foreign keys.
-                broken_constraints = self.db_to.unfulfilled_fks(new_table)
-                if not broken_constraints:
-                    good_tables[new_table_name] = True
+                if foreign_table in tracking_db.tables:
                     continue
-
-                # otherwise it is no good: record as such
-                tables_to_add.remove(new_table_name)
-                for error in broken_constraints.values():
-                    errors_1215.append(error['error'])
-
+                missing[new_table_name].add(foreign_table)
+                waiting_on.setdefault(foreign_table, []).append(new_table_name)
+
+        # tables are only checked against the tracking db once everything they were waiting
+        # on has been added, so unfulfilled_fks() gets called at most once per table
+        added = set()
+        queue = deque([table_name for table_name in tables_to_add if not missing[table_name]])
+        while queue:
+            new_table_name = queue.popleft()
+            new_table = self.db_to.tables[new_table_name]
+
+            # it may still have problems that don't come from the tables being added
+            # (missing columns, for instance), in which case it has to wait
+            if tracking_db.unfulfilled_fks(new_table):
+                continue
+
+            # if we found no problems then we can add this table to our
+            # tracking db and add the "CREATE TABLE" operation to our list of operations
+            operations.append(new_table.create())
+            tracking_db.add_table(new_table)
+            added.add(new_table_name)
+
+            for waiting_table_name in waiting_on.get(new_table_name, []):
+                missing[waiting_table_name].discard(new_table_name)
+                if not missing[waiting_table_name]:
+                    queue.append(waiting_table_name)
+
+        # For everything left we have to decide if this table is fulfillable eventually
+        # (because it has dependencies that have not been added), or if there is a mistake
+        # with a foreign key that we can't fix.  To tell the difference we just check if the
+        # database we are migrating to can fulfill these foreign keys.
+        remaining = []
+        for new_table_name in tables_to_add:
+            if new_table_name in added:
+                continue
+
+            broken_constraints = self.db_to.unfulfilled_fks(self.db_to.tables[new_table_name])
+            if not broken_constraints:
+                remaining.append(new_table_name)
+                continue
+
+            # otherwise it is no good: record as such
+            for error in broken_constraints.values():
+                errors_1215.append(error['error'])
+
+        tables_to_add[:] = remaining
         return (errors_1215, operations)
 
     def _process_updates(self, tracking_db, tables_to_update):
@@ -331,26 +363,18 @@ class mygration:
         :rtype: {'fks': list, 'kitchen_sink': list}
         """
 
-        tables_to_update = tables_to_update[:]
-
         operations = {'removed_fks': [], 'fks': [], 'kitchen_sink': []}
 
         for update_table_name in tables_to_update:
             target_table = self.db_to.tables[update_table_name]
             source_table = self.db_from.tables[update_table_name]
 
+            # each category comes back as a single alter table operation, which
+            # the tracking database can apply all in one go
             more_operations = source_table.to(target_table, True)
-            if 'removed_fks' in more_operations:
-                operations['removed_fks'].append(more_operations['removed_fks'])
-                for operation in more_operations['removed_fks']:
-                    tracking_db.apply_operation(update_table_name, operation)
-            if 'fks' in more_operations:
-                operations['fks'].append(more_operations['fks'])
-                for operation in more_operations['fks']:
-                    tracking_db.apply_operation(update_table_name, operation)
-            if 'kitchen_sink' in more_operations:
-                operations['kitchen_sink'].append(more_operations['kitchen_sink'])
-                for operation in more_operations['kitchen_sink']:
-                    tracking_db.apply_operation(update_table_name, operation)
+            for category in ('removed_fks', 'fks', 'kitchen_sink'):
+                if category in more_operations:
+                    operations[category].append(more_operations[category])
+                    tracking_db.apply_operation(update_table_name, more_operations[category])
 
         return operations
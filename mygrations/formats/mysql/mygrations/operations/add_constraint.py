@@ -1,6 +1,8 @@
 class add_constraint:
     """ Generates a partial SQL command to add a FK to a table """
 
+    __slots__ = ('constraint', )
+
     def __init__(self, constraint):
         self.constraint = constraint
 
@@ -1,6 +1,8 @@
 class alter_table:
     """ Generates an SQL command to alter a table """
 
+    __slots__ = ('_table', '_operations')
+
     def __init__(self, table):
         self._table = table
         self._operations = []
@@ -8,6 +10,18 @@ class alter_table:
     def add_operation(self, operation):
         self._operations.append(operation)
 
+    def extend_operations(self, operations):
+        self._operations.extend(operations)
+
+    def apply_to_table(self, table):
+        """ Applies all of the operations in the alter to the table
+
+        :param table: The table to apply the operations to
+        :param type: mygrations.formats.mysql.definitions.table
+        """
+        for operation in self._operations:
+            operation.apply_to_table(table)
+
     @property
     def table_name(self):
         """ Public getter.  Returns the name of the table.
@@ -22,7 +36,7 @@ class alter_table:
         return len(self._operations)
 
     def __bool__(self):
-        return True if len(self._operations) else False
+        return bool(self._operations)
 
     def __str__(self):
         return 'ALTER TABLE `%s` %s;' % (self._table, ', '.join([str(x) for x in self._operations]))
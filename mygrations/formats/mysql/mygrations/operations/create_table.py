@@ -1,16 +1,19 @@
 class create_table:
     """ Generates an SQL command to create a table """
 
-    def __init__(self, table, nice=False):
+    def __init__(self, table, nice=False, exclude_constraints=None):
         """ Create table constructor
 
         :param table: The table to build a create table command for
         :param nice: Whether or not to return a nicely formatted CREATE TABLE command
+        :param exclude_constraints: Names of constraints to leave out of the CREATE TABLE command
         :type table: formats.mysql.definitions.table
         :type nice: bool
+        :type exclude_constraints: set|None
         """
         self.table = table
         self._nice = nice
+        self._exclude_constraints = exclude_constraints if exclude_constraints else ()
 
     @property
     def table_name(self):
@@ -23,16 +26,4 @@ class create_table:
         return self.table.name
 
     def __str__(self):
-        newline = '\n' if self._nice else ''
-        padding = '  ' if self._nice else ''
-        body = ['%s%s' % (padding, str(self.table.columns[col])) for col in self.table.columns]
-        body.extend(['%s%s' % (padding, str(self.table.indexes[index])) for index in self.table.indexes])
-        body.extend([
-            '%s%s' % (padding, str(self.table.constraints[constraint])) for constraint in self.table.constraints
-        ])
-        options = ['%s=%s' % (opt.name, opt.value) for opt in self.table.options]
-        if options:
-            options = ' %s' % ' '.join(options)
-        else:
-            options = ''
-        return 'CREATE TABLE `%s` (%s%s%s)%s;' % (self.table.name, newline, ",\n".join(body), newline, options)
+        return self.table.create_command(self._nice, self._exclude_constraints)
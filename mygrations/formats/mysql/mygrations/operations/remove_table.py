@@ -1,6 +1,8 @@
 class remove_table:
     """ Generates an SQL command to drop a table """
 
+    __slots__ = ('_table_name', )
+
     def __init__(self, table_name):
         if type(table_name) != str:
             self._table_name = table_name.name
@@ -101,3 +101,92 @@ class test_database(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             db1.remove_table(new_table)
+
+    def test_clone_for_tracking(self):
+
+        db1 = self._get_sample_db()
+        clone = db1.clone_for_tracking()
+
+        self.assertEquals(['logs', 'more_logs'], sorted(clone.tables.keys()))
+        self.assertEquals(str(db1.tables['logs']), str(clone.tables['logs']))
+
+        # changes to the clone don't make it back to the original
+        clone.remove_table(clone.tables['more_logs'])
+        clone.tables['logs'].remove_column('traceback')
+        self.assertEquals(2, len(db1.tables))
+        self.assertTrue('traceback' in db1.tables['logs'].columns)
+        self.assertFalse('traceback' in clone.tables['logs'].columns)
+
+    def test_fk_edges(self):
+
+        db = self._get_sample_db()
+        self.assertEquals({}, db.fk_edges)
+
+        new_table = create_parser()
+        new_table.parse(
+            """CREATE TABLE `log_changes` (
+            `id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+            `log_id` INT(10) UNSIGNED NOT NULL,
+            `parent_log_id` INT(10) UNSIGNED NOT NULL,
+            `more_log_id` INT(10) UNSIGNED NOT NULL,
+            PRIMARY KEY (id),
+            KEY `log_changes_log_id` (`log_id`),
+            KEY `log_changes_parent_log_id` (`parent_log_id`),
+            KEY `log_changes_more_log_id` (`more_log_id`),
+            CONSTRAINT `log_changes_log_id_fk` FOREIGN KEY (`log_id`) REFERENCES `logs` (`id`),
+            CONSTRAINT `log_changes_parent_log_id_fk` FOREIGN KEY (`parent_log_id`) REFERENCES `logs` (`id`),
+            CONSTRAINT `log_changes_more_log_id_fk` FOREIGN KEY (`more_log_id`) REFERENCES `more_logs` (`id`)
+            );
+        """
+        )
+
+        db.add_table(new_table)
+        self.assertEquals({'log_changes': ('logs', 'more_logs')}, db.fk_edges)
+
+        db.remove_table(new_table)
+        self.assertEquals({}, db.fk_edges)
+
+    def test_strongly_connected_components(self):
+
+        strings = [
+            """
+            CREATE TABLE `tasks` (
+                `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+                `account_id` int(10) unsigned NOT NULL,
+                `repeating_task_id` int(10) unsigned NOT NULL,
+                PRIMARY KEY (`id`),
+                KEY `account_id_tasks` (`account_id`),
+                KEY `repeating_task_id_tasks` (`repeating_task_id`),
+                CONSTRAINT `account_id_tasks_fk` FOREIGN KEY (`account_id`) REFERENCES `accounts` (`id`),
+                CONSTRAINT `repeating_task_id_tasks_fk` FOREIGN KEY (`repeating_task_id`) REFERENCES `repeating_tasks` (`id`)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+        """, """
+            CREATE TABLE `repeating_tasks` (
+                `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+                `task_id` int(10) unsigned NOT NULL,
+                PRIMARY KEY (`id`),
+                KEY `task_id_rts` (`task_id`),
+                CONSTRAINT `task_id_rts_fk` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+        """, """
+            CREATE TABLE `notes` (
+                `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+                `task_id` int(10) unsigned NOT NULL,
+                PRIMARY KEY (`id`),
+                KEY `task_id_notes` (`task_id`),
+                CONSTRAINT `task_id_notes_fk` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+        """, """
+            CREATE TABLE `accounts` (
+                `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+                PRIMARY KEY (`id`)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+        """
+        ]
+        db = database_reader(strings)
+
+        components = db.strongly_connected_components(['notes', 'tasks', 'repeating_tasks', 'accounts'])
+        self.assertEquals([['accounts'], ['tasks', 'repeating_tasks'], ['notes']], components)
+
+        # foreign keys to tables that weren't asked for are ignored
+        self.assertEquals([['tasks'], ['notes']], db.strongly_connected_components(['notes', 'tasks']))
@@ -183,3 +183,13 @@ class test_table_difference(unittest.TestCase):
         operations = b.to(a)
         self.assertEquals(1, len(operations))
         self.assertEquals('ALTER TABLE `tasks` DROP PRIMARY KEY;', str(operations[0]))
+
+    def test_no_empty_alters(self):
+        (a, b) = self._get_parsers()
+
+        # only keys changed, so there should be nothing but a kitchen sink alter
+        operations = a.to(b, True)
+        self.assertEquals(['kitchen_sink'], list(operations.keys()))
+
+        self.assertEquals([], a.to(a))
+        self.assertEquals({}, a.to(a, True))
@@ -0,0 +1,43 @@
+import unittest
+
+from mygrations.formats.mysql.file_reader.create_parser import create_parser
+from mygrations.formats.mysql.definitions.column import column
+from mygrations.formats.mysql.definitions.index import index
+class test_table_fingerprint(unittest.TestCase):
+    def _get_table(self):
+        table = create_parser()
+        table.parse(
+            """CREATE TABLE `tasks` (
+            `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+            `account_id` int(10) DEFAULT NULL,
+            `task` varchar(255) DEFAULT NULL,
+            PRIMARY KEY (id),
+            KEY `tasks_account_id` (`account_id`)
+            );
+        """
+        )
+
+        return table
+
+    def test_same_structure(self):
+        self.assertEquals(self._get_table().fingerprint(), self._get_table().fingerprint())
+
+    def test_column_changes(self):
+        a = self._get_table()
+        b = self._get_table()
+
+        b.add_column(column(**{"name": "subject", "column_type": "TEXT", "length": ""}))
+        self.assertNotEqual(a.fingerprint(), b.fingerprint())
+        self.assertEquals(1, len(a.to(b)))
+
+        b.remove_column('subject')
+        self.assertEquals(a.fingerprint(), b.fingerprint())
+        self.assertEquals([], a.to(b))
+
+    def test_key_changes(self):
+        a = self._get_table()
+        b = self._get_table()
+
+        b.change_key(index('tasks_account_id', ['account_id', 'task']))
+        self.assertNotEqual(a.fingerprint(), b.fingerprint())
+        self.assertEquals(1, len(a.to(b)))
@@ -60,6 +60,15 @@ class test_table_operations_column(unittest.TestCase):
         table.remove_column('task')
         self.assertFalse('task' in table.columns)
 
+    def test_column_before_after_remove(self):
+        table = self._get_default_table()
+        self.assertEquals('task', table.column_before('subject'))
+
+        table.remove_column('task')
+        self.assertEquals('account_id', table.column_before('subject'))
+        with self.assertRaises(ValueError):
+            table.column_before('task')
+
     def test_change_column(self):
         table = self._get_default_table()
         new_subject = column(**{"name": "subject", "column_type": "TEXT", "length": ""})
@@ -41,6 +41,24 @@ class test_table_operations_key(unittest.TestCase):
         self.assertFalse('tasks_account_id' in table.indexes)
         self.assertFalse(table.column_is_indexed('account_id'))
 
+    def test_remove_key_with_another_index_on_column(self):
+        table = self._get_default_table()
+        table.add_key(index('account_id_task', ['account_id', 'task']))
+
+        table.remove_key('tasks_account_id')
+        self.assertTrue(table.column_is_indexed('account_id'))
+
+        table.remove_key('account_id_task')
+        self.assertFalse(table.column_is_indexed('account_id'))
+
+    def test_change_key_with_another_index_on_column(self):
+        table = self._get_default_table()
+        table.add_key(index('account_id_task', ['account_id', 'task']))
+
+        table.change_key(index('tasks_account_id', ['task']))
+        self.assertTrue(table.column_is_indexed('account_id'))
+        self.assertTrue(table.column_is_indexed('task'))
+
     def test_cannot_remove_missing_key(self):
         table = self._get_default_table()
         with self.assertRaises(ValueError):
@@ -52,3 +52,49 @@ class test_table_difference(unittest.TestCase):
             str(a).replace("\n", ' '),
             "CREATE TABLE `tasks` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT, `account_id` INT(10), `task` VARCHAR(255), PRIMARY KEY (`id`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"
         )
+
+    def test_exclude_constraints(self):
+        a = create_parser()
+        a.parse(
+            """CREATE TABLE `tasks` (
+            `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+            `account_id` int(10) DEFAULT NULL,
+            PRIMARY KEY (id),
+            CONSTRAINT `tasks_fk` FOREIGN KEY (`account_id`) REFERENCES `accounts` (`id`) ON DELETE CASCADE
+            );
+        """
+        )
+
+        self.assertEquals(
+            str(a.create(exclude_constraints=set(['tasks_fk']))).replace("\n", ' '),
+            "CREATE TABLE `tasks` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT, `account_id` INT(10), PRIMARY KEY (`id`));"
+        )
+        self.assertTrue('tasks_fk' in a.constraints)
+
+    def test_create_command_is_cached_until_changed(self):
+        a = create_parser()
+        a.parse(
+            """CREATE TABLE `tasks` (
+            `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+            `account_id` int(10) DEFAULT NULL,
+            PRIMARY KEY (id),
+            KEY `account_id` (`account_id`),
+            CONSTRAINT `tasks_fk` FOREIGN KEY (`account_id`) REFERENCES `accounts` (`id`) ON DELETE CASCADE
+            );
+        """
+        )
+
+        # the rendered command is only built once
+        op = a.create()
+        self.assertTrue(str(op) is str(a.create()))
+        self.assertFalse(str(op) is str(a.create(exclude_constraints=set(['tasks_fk']))))
+        self.assertTrue('tasks_fk' in str(op))
+
+        # but operations always render the current structure of the table
+        a.remove_constraint('tasks_fk')
+        a.remove_key('account_id')
+        a.remove_column('account_id')
+        self.assertEquals(
+            str(op).replace("\n", ' '),
+            "CREATE TABLE `tasks` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT, PRIMARY KEY (`id`));"
+        )
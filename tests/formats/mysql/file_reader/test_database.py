@@ -68,3 +68,37 @@ class test_database(unittest.TestCase):
         database = database_reader(strings)
 
         self.assertTrue('not allowed to have a default value for column message in table logs' in database.errors[0])
+
+    def test_rows_without_ids(self):
+
+        strings = [
+            """
+            CREATE TABLE `logs` (
+                `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+                `message` TEXT NOT NULL,
+                PRIMARY KEY (`id`)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+        """, """
+            INSERT INTO logs (`message`) VALUES ('hey'),('sup');
+            INSERT INTO logs (`id`, `message`) VALUES (10,'yo');
+            INSERT INTO logs (`message`) VALUES ('bye');
+        """
+        ]
+        database = database_reader(strings)
+
+        logs = database.tables['logs']
+        self.assertEquals([1, 2, 10, 11], list(logs.rows.keys()))
+        self.assertEquals(12, logs.auto_increment)
+
+    def test_unparseable_create(self):
+
+        database = database_reader(["CREATE TABLE `foo` garbage"])
+        self.assertEquals(['Unrecognized MySQL command: garbage'], database.errors)
+
+        # a CREATE TABLE command that doesn't finish parsing still leaves a usable table behind
+        database = database_reader(["CREATE TABLE `foo` (`id` int(10) NOT NULL"])
+        self.assertEquals([], database.errors)
+        table = database.tables['']
+        self.assertEquals('', table.name)
+        self.assertEquals([], table.errors)
+        self.assertEquals({}, table.columns)
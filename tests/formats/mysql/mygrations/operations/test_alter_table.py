@@ -0,0 +1,24 @@
+import unittest
+from mygrations.formats.mysql.mygrations.operations.alter_table import alter_table
+from mygrations.formats.mysql.mygrations.operations.add_column import add_column
+from mygrations.formats.mysql.mygrations.operations.remove_column import remove_column
+from mygrations.formats.mysql.file_reader.create_parser import create_parser
+from mygrations.formats.mysql.definitions.column import column
+class test_alter_table(unittest.TestCase):
+    def test_apply_to_table(self):
+        table = create_parser()
+        table.parse(
+            """CREATE TABLE `tasks` (
+            `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
+            `account_id` int(10) DEFAULT NULL,
+            PRIMARY KEY (id)
+            );
+        """
+        )
+
+        op = alter_table('tasks')
+        op.add_operation(add_column(column(**{"name": "subject", "column_type": "TEXT", "length": ""}), 'id'))
+        op.add_operation(remove_column(table.columns['account_id']))
+        op.apply_to_table(table)
+
+        self.assertEquals(['id', 'subject'], list(table.columns.keys()))
@@ -19,3 +19,16 @@ class test_add_only(unittest.TestCase):
 
         self.assertTrue(table1 in ops)
         self.assertTrue(table2 in ops)
+
+    def test_iterate_without_operations(self):
+        """ Iterating over the mygration generates the same operations as the operations list """
+
+        table1 = "CREATE TABLE `zlogs` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,\n`message` TEXT NOT NULL,\n`traceback` TEXT,\nPRIMARY KEY (`id`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"
+        table2 = "CREATE TABLE `people` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,\n`first_name` VARCHAR(255) NOT NULL DEFAULT '',\n`last_name` VARCHAR(255) NOT NULL DEFAULT '',\nPRIMARY KEY (`id`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"
+        db = database_reader([table1, table2])
+
+        iterated = [str(op) for op in mygration(db)]
+        listed = [str(op) for op in mygration(db).operations]
+
+        self.assertEquals(4, len(iterated))
+        self.assertEquals(listed, iterated)
@@ -0,0 +1,77 @@
+import unittest
+
+from mygrations.formats.mysql.file_reader.database import database as database_reader
+from mygrations.formats.mysql.mygrations.mygration import mygration
+class test_old_process(unittest.TestCase):
+    def test_adds_after_updates(self):
+        """ A new table has a foreign key on a column that only exists after another table is updated """
+
+        logs_from = """CREATE TABLE `logs` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+PRIMARY KEY (`id`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+        gone = """CREATE TABLE `gone` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+PRIMARY KEY (`id`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+        logs_to = """CREATE TABLE `logs` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+`code` INT(10) UNSIGNED NOT NULL,
+PRIMARY KEY (`id`),
+KEY `code` (`code`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+        log_refs = """CREATE TABLE `log_refs` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+`code` INT(10) UNSIGNED NOT NULL,
+PRIMARY KEY (`id`),
+KEY `code` (`code`),
+CONSTRAINT `code_fk` FOREIGN KEY (`code`) REFERENCES `logs` (`code`) ON DELETE CASCADE ON UPDATE CASCADE) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+
+        mygrate = mygration(database_reader([logs_to, log_refs]), database_reader([logs_from, gone]))
+        ops = [str(op) for op in mygrate._old_process()]
+
+        self.assertEquals(3, len(ops))
+        self.assertEquals('ALTER TABLE `logs` ADD `code` INT(10) UNSIGNED NOT NULL AFTER `id`, ADD KEY `code` (`code`);', ops[0])
+        self.assertEquals(log_refs.replace("\n", ' '), ops[1].replace("\n", ' '))
+        self.assertEquals('DROP TABLE gone;', ops[2])
+
+    def test_cycles_only_defer_one_fk(self):
+        """ Tables in a foreign key loop are created with as many of their foreign keys as possible """
+
+        tasks = """CREATE TABLE `tasks` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+`repeating_task_id` INT(10) UNSIGNED NOT NULL,
+PRIMARY KEY (`id`),
+KEY `repeating_task_id_tasks` (`repeating_task_id`),
+CONSTRAINT `repeating_task_id_tasks_fk` FOREIGN KEY (`repeating_task_id`) REFERENCES `repeating_tasks` (`id`) ON DELETE CASCADE ON UPDATE CASCADE) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+        repeating_tasks = """CREATE TABLE `repeating_tasks` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+`task_id` INT(10) UNSIGNED NOT NULL,
+PRIMARY KEY (`id`),
+KEY `task_id_rts` (`task_id`),
+CONSTRAINT `task_id_rts_fk` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE ON UPDATE CASCADE) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+        notes = """CREATE TABLE `notes` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+`task_id` INT(10) UNSIGNED NOT NULL,
+PRIMARY KEY (`id`),
+KEY `task_id_notes` (`task_id`),
+CONSTRAINT `task_id_notes_fk` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE ON UPDATE CASCADE) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+
+        mygrate = mygration(database_reader([notes, tasks, repeating_tasks]))
+        ops = [str(op).replace("\n", ' ') for op in mygrate._old_process()]
+
+        self.assertEquals(4, len(ops))
+        self.assertTrue(ops[0].startswith('CREATE TABLE `tasks`'))
+        self.assertFalse('CONSTRAINT' in ops[0])
+        self.assertEquals(repeating_tasks.replace("\n", ' '), ops[1])
+        self.assertEquals(notes.replace("\n", ' '), ops[2])
+        self.assertEquals(
+            'ALTER TABLE `tasks` ADD CONSTRAINT `repeating_task_id_tasks_fk` FOREIGN KEY (`repeating_task_id`) REFERENCES `repeating_tasks` (`id`) ON DELETE CASCADE ON UPDATE CASCADE;',
+            ops[3]
+        )
+
+    def test_1215_errors_return_no_operations(self):
+        """ If the database we are migrating to can't fulfill its own foreign keys then there is nothing to do """
+
+        logs = """CREATE TABLE `logs` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+PRIMARY KEY (`id`)) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+        log_refs = """CREATE TABLE `log_refs` (`id` INT(10) UNSIGNED NOT NULL AUTO_INCREMENT,
+`code` INT(10) UNSIGNED NOT NULL,
+PRIMARY KEY (`id`),
+KEY `code` (`code`),
+CONSTRAINT `code_fk` FOREIGN KEY (`code`) REFERENCES `logs` (`code`) ON DELETE CASCADE ON UPDATE CASCADE) ENGINE=InnoDB DEFAULT CHARSET=utf8;"""
+
+        mygrate = mygration(database_reader([logs, log_refs]), database_reader([logs]))
+
+        self.assertEquals(1, len(mygrate.errors_1215))
+        self.assertEquals([], mygrate._old_process())